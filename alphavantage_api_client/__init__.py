@@ -1,3 +1,14 @@
 from alphavantage_api_client.client import AlphavantageClient
+from alphavantage_api_client.cache import ResponseCache
+from alphavantage_api_client.rate_limiter import RateLimiter
 from alphavantage_api_client.models import GlobalQuote, Quote, AccountingReport, CompanyOverview, RealGDP, \
     CsvNotSupported
+
+
+def __getattr__(name):
+    # the async client imports asyncio, load it on first use so synchronous users don't pay for it
+    if name == "AsyncAlphavantageClient":
+        from alphavantage_api_client.async_client import AsyncAlphavantageClient
+
+        return AsyncAlphavantageClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,249 @@
+import asyncio
+import importlib.util
+from alphavantage_api_client.client import AlphavantageClient, _DEFAULTS_GLOBAL_QUOTE, _DEFAULTS_INTRADAY_QUOTE, \
+    _DEFAULTS_INCOME_STATEMENT, _DEFAULTS_CASH_FLOW, _DEFAULTS_EARNINGS, _DEFAULTS_COMPANY_OVERVIEW, \
+    _DEFAULTS_CRYPTO_INTRADAY, _DEFAULTS_REAL_GDP, _DEFAULTS_TECHNICAL_INDICATOR, _is_cacheable
+from alphavantage_api_client.models import GlobalQuote, Quote, AccountingReport, CompanyOverview, RealGDP, \
+    CsvNotSupported
+
+
+class AsyncAlphavantageClient(AlphavantageClient):
+    """Asyncio version of ``AlphavantageClient``
+
+    Every ``get_*`` method is a coroutine returning the same model as its synchronous counterpart, so many symbols can
+    be requested concurrently. The http client is opened and closed by the ``async with`` block (requires ``httpx``).
+    When ``h2`` is installed the in-flight requests are multiplexed over a single HTTP/2 connection.
+
+    Example:
+        async with AsyncAlphavantageClient() as client:
+            quotes = await asyncio.gather(*(client.get_global_quote({"symbol": s}) for s in symbols))
+    """
+    __slots__ = ("_client",)
+
+    def __init__(self):
+        super().__init__()
+        self._client = None
+
+    async def __aenter__(self):
+        import httpx  # optional dependency, only needed by the async client
+
+        http2 = importlib.util.find_spec("h2") is not None
+        self._client = httpx.AsyncClient(http2=http2,
+                                         limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                                         timeout=30)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self._client.aclose()
+        self._client = None
+
+    async def get_global_quote(self, event: dict, validate: bool = False) -> GlobalQuote:
+        """ Lightweight access to obtain stock quote data
+
+        Args:
+            event (dict): A ``dict`` containing the paramters supported by the api.
+            Minimum required value is ``symbol (str)``
+            validate (bool): Run pydantic validation on the response instead of trusting it. Defaults to ``False``
+
+        Returns:
+            :rtype: GlobalQuote
+
+        """
+        json_request = self.__create_api_request_from__(_DEFAULTS_GLOBAL_QUOTE, event)
+        json_response = await self.get_data_from_alpha_vantage(json_request)
+
+        return self.__create_model_from__(GlobalQuote, json_response, validate)
+
+    async def get_many_global_quotes(self, symbols: list, *, validate: bool = False) -> list:
+        """ Obtain the stock quote data for many symbols at once
+
+        Args:
+            symbols (list): The ``str`` symbols to quote
+            validate (bool): Run pydantic validation on the response instead of trusting it. Defaults to ``False``
+
+        Returns:
+            :rtype: list[GlobalQuote] in the same order as ``symbols``
+
+        """
+        return list(await asyncio.gather(*(self.get_global_quote({"symbol": symbol}, validate) for symbol in symbols)))
+
+    async def get_intraday_quote(self, event: dict, validate: bool = False) -> Quote:
+        """ Intraday time series data covering extened trading hours.
+
+        Args:
+            event (dict): A Dictionary of parameters that will be passed to the api.
+            Minimum required is ``symbol`` = ``str``
+            validate (bool): Run pydantic validation on the response instead of trusting it. Defaults to ``False``
+
+        Returns:
+            :rtype: Quote
+
+        """
+        json_request = self.__create_api_request_from__(_DEFAULTS_INTRADAY_QUOTE, event)
+        json_response = await self.get_data_from_alpha_vantage(json_request)
+
+        return self.__create_model_from__(Quote, json_response, validate)
+
+    async def get_income_statement(self, event: dict, validate: bool = False) -> AccountingReport:
+        """
+        Annual and quarterly income statements for the company of interest.
+
+        Args:
+            event (dict): A Dictionary of parameters that will be passed to the api.
+            Minimum required is ``symbol`` = ``str``
+            validate (bool): Run pydantic validation on the response instead of trusting it. Defaults to ``False``
+
+        Returns:
+            :rtype: AccountingReport
+
+        """
+        if event.get("datatype") == "csv":
+            raise CsvNotSupported(_DEFAULTS_INCOME_STATEMENT.get("function"), event)
+        json_request = self.__create_api_request_from__(_DEFAULTS_INCOME_STATEMENT, event)
+        json_response = await self.get_data_from_alpha_vantage(json_request)
+
+        return self.__create_model_from__(AccountingReport, json_response, validate)
+
+    async def get_cash_flow(self, event: dict, validate: bool = False) -> AccountingReport:
+        """
+        Annual and quarterly cash flow for the company of interest.
+
+        Args:
+            event (dict): A Dictionary of parameters that will be passed to the api.
+            Minimum required is ``symbol`` = ``str``
+            validate (bool): Run pydantic validation on the response instead of trusting it. Defaults to ``False``
+
+        Returns:
+            :rtype: AccountingReport
+
+        """
+        if event.get("datatype") == "csv":
+            raise CsvNotSupported(_DEFAULTS_CASH_FLOW.get("function"), event)
+        json_request = self.__create_api_request_from__(_DEFAULTS_CASH_FLOW, event)
+        json_response = await self.get_data_from_alpha_vantage(json_request)
+
+        return self.__create_model_from__(AccountingReport, json_response, validate)
+
+    async def get_earnings(self, event: dict, validate: bool = False) -> AccountingReport:
+        """
+        Annual and quarterly earnings (EPS) for the company of interest.
+
+        Args:
+            event (dict): A Dictionary of parameters that will be passed to the api.
+            Minimum required is ``symbol`` = ``str``
+            validate (bool): Run pydantic validation on the response instead of trusting it. Defaults to ``False``
+
+        Returns:
+            :rtype: AccountingReport
+
+        """
+        if event.get("datatype") == "csv":
+            raise CsvNotSupported(_DEFAULTS_EARNINGS.get("function"), event)
+        json_request = self.__create_api_request_from__(_DEFAULTS_EARNINGS, event)
+        json_response = await self.get_data_from_alpha_vantage(json_request)
+
+        return self.__create_model_from__(AccountingReport, json_response, validate)
+
+    async def get_company_overview(self, event: dict, validate: bool = False) -> CompanyOverview:
+        """
+        Company information, financial ratios, and other key metrics for the equity specified.
+
+        Args:
+            event (dict): A Dictionary of parameters that will be passed to the api.
+            Minimum required is ``symbol`` = ``str``
+            validate (bool): Run pydantic validation on the response instead of trusting it. Defaults to ``False``
+
+        Returns:
+            :rtype: CompanyOverview
+
+        """
+        if event.get("datatype") == "csv":
+            raise CsvNotSupported(_DEFAULTS_COMPANY_OVERVIEW.get("function"), event)
+        json_request = self.__create_api_request_from__(_DEFAULTS_COMPANY_OVERVIEW, event)
+        json_response = await self.get_data_from_alpha_vantage(json_request)
+
+        return self.__create_model_from__(CompanyOverview, json_response, validate)
+
+    async def get_crypto_intraday(self, event: dict, validate: bool = False) -> Quote:
+        """
+        Intraday time series of the cryptocurrency specified, updated realtime.
+
+        Args:
+            event (dict): A Dictionary of parameters that will be passed to the api.
+            Minimum required is ``symbol`` = (``str``)
+            validate (bool): Run pydantic validation on the response instead of trusting it. Defaults to ``False``
+
+        Returns:
+            :rtype: Quote
+
+        """
+        json_request = self.__create_api_request_from__(_DEFAULTS_CRYPTO_INTRADAY, event)
+        json_response = await self.get_data_from_alpha_vantage(json_request)
+
+        return self.__create_model_from__(Quote, json_response, validate)
+
+    async def get_real_gdp(self, event: dict = {}, validate: bool = False) -> RealGDP:
+        """
+        Annual and quarterly Real GDP of the United States.
+
+        Args:
+            event (dict): Not required. You can pass in any parameters supported by the api
+            validate (bool): Run pydantic validation on the response instead of trusting it. Defaults to ``False``
+
+        Returns:
+            :rtype: RealGDP
+
+        """
+        json_request = self.__create_api_request_from__(_DEFAULTS_REAL_GDP, event)
+        json_response = await self.get_data_from_alpha_vantage(json_request)
+
+        return self.__create_model_from__(RealGDP, json_response, validate)
+
+    async def get_technical_indicator(self, event: dict, validate: bool = False) -> Quote:
+        """
+        Default technical indicator is SMA. You can change this by passing in ``function`` = ``[your indicator]``
+
+        Args:
+            event (dict): Parameters supported by the API
+            validate (bool): Run pydantic validation on the response instead of trusting it. Defaults to ``False``
+
+        Returns:
+            :rtype: Quote
+
+        """
+        json_request = self.__create_api_request_from__(_DEFAULTS_TECHNICAL_INDICATOR, event)
+        json_response = await self.get_data_from_alpha_vantage(json_request)
+        json_response["indicator"] = event.get("function")
+
+        return self.__create_model_from__(Quote, json_response, validate)
+
+    async def get_data_from_alpha_vantage(self, event: dict) -> dict:
+        """
+        Async version of ``AlphavantageClient.get_data_from_alpha_vantage``. Must be called inside ``async with``.
+
+        Args:
+            event (dictionary): The url parameters supported by the web api
+
+        Returns:
+            :rtype: dict
+
+        """
+        if self._client is None:
+            raise RuntimeError("use 'async with AsyncAlphavantageClient()' before calling get_* methods")
+        checks, loggable_event = self.__prepare_request__(event)
+        # the cache does blocking sqlite i/o, run it on the default executor so it doesn't stall the event loop
+        loop = asyncio.get_running_loop()
+        if self._cache is not None:
+            cached_response = await loop.run_in_executor(None, self._cache.get, loggable_event)
+            if cached_response is not None:
+                return cached_response
+
+        # fetch data from API
+        if self._limiter is not None:
+            await self._limiter.acquire_async()
+        r = await self._client.get(self._base_url, params=event)
+        requested_data = self.__build_response__(checks, r, event, loggable_event)
+        if self._cache is not None and _is_cacheable(requested_data):
+            await loop.run_in_executor(None, self._cache.put, loggable_event, requested_data)
+
+        return requested_data
@@ -0,0 +1,94 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlencode
+from .serialization import dumps, loads
+
+# seconds a response stays fresh, by alpha vantage function
+_DEFAULT_TTLS = {
+    "INCOME_STATEMENT": 86400,
+    "BALANCE_SHEET": 86400,
+    "CASH_FLOW": 86400,
+    "EARNINGS": 86400,
+    "OVERVIEW": 86400,
+    "TIME_SERIES_INTRADAY": 60,
+    "CRYPTO_INTRADAY": 60,
+    "REAL_GDP": 604800
+}
+_DEFAULT_TTL = 60
+
+
+class ResponseCache:
+    """Sqlite backed cache of successful alpha vantage responses
+
+    Fundamentals and economic indicators change at most daily, so repeating a request within its time to live is
+    answered from disk instead of the network. Responses are keyed by the request parameters without the api key.
+    Expired responses are deleted whenever a new response is stored, so the file doesn't grow with every symbol.
+    """
+
+    def __init__(self, path: str = "~/.alphavantage_cache", ttls: dict = None, default_ttl: int = _DEFAULT_TTL):
+        """
+
+        Args:
+            path (str): Location of the sqlite database file
+            ttls (dict): Seconds a response stays fresh by ``function``, merged over the defaults
+            default_ttl (int): Seconds a response stays fresh when its ``function`` is not in ``ttls``
+        """
+        self.__ttls__ = {**_DEFAULT_TTLS, **(ttls or {})}
+        self.__default_ttl__ = default_ttl
+        self.__lock__ = threading.Lock()
+        self.__connection__ = sqlite3.connect(os.path.expanduser(path), check_same_thread=False)
+        with self.__lock__, self.__connection__:
+            self.__connection__.execute("CREATE TABLE IF NOT EXISTS responses "
+                                        "(key TEXT PRIMARY KEY, expires_at REAL, response TEXT)")
+            self.__connection__.execute("CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)")
+
+    def __key__(self, event: dict) -> str:
+        params = urlencode(sorted((key, value) for key, value in event.items() if key != "apikey"))
+
+        return hashlib.blake2b(params.encode("utf-8")).hexdigest()
+
+    def get(self, event: dict) -> Optional[dict]:
+        """
+
+        Args:
+            event (dict): The url parameters of the request
+
+        Returns:
+            :rtype: dict or None when the response is not cached or has expired
+        """
+        with self.__lock__:
+            row = self.__connection__.execute("SELECT expires_at, response FROM responses WHERE key = ?",
+                                              (self.__key__(event),)).fetchone()
+        if row is None or row[0] < time.time():
+            return None
+
+        return loads(row[1])
+
+    def put(self, event: dict, response: dict):
+        """
+
+        Args:
+            event (dict): The url parameters of the request
+            response (dict): The response returned by ``AlphavantageClient.get_data_from_alpha_vantage``
+
+        Returns:
+            :rtype: None
+        """
+        ttl = self.__ttls__.get(event.get("function"), self.__default_ttl__)
+        now = time.time()
+        with self.__lock__, self.__connection__:
+            self.__connection__.execute("DELETE FROM responses WHERE expires_at < ?", (now,))
+            self.__connection__.execute("INSERT OR REPLACE INTO responses (key, expires_at, response) VALUES (?, ?, ?)",
+                                        (self.__key__(event), now + ttl, dumps(response)))
+
+    def clear(self):
+        """ Remove every cached response """
+        with self.__lock__, self.__connection__:
+            self.__connection__.execute("DELETE FROM responses")
+
+    def close(self):
+        self.__connection__.close()
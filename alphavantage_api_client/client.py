@@ -1,12 +1,86 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import configparser
+from concurrent.futures import ThreadPoolExecutor
 from .response_validation_rules import ValidationRuleChecks
-import json
+from .serialization import dumps
+from .cache import ResponseCache
+from .rate_limiter import RateLimiter
 from alphavantage_api_client.models import GlobalQuote, Quote, AccountingReport, CompanyOverview, RealGDP, \
     CsvNotSupported
-import copy
+import functools
 import logging
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+_ALPHAVANTAGE_CONFIG_PATH = os.path.join(os.path.expanduser("~"), ".alphavantage")
+
+# default url parameters for each endpoint, read only since they are shared by every call
+_DEFAULTS_GLOBAL_QUOTE = MappingProxyType({
+    "function": "GLOBAL_QUOTE"
+})
+_DEFAULTS_INTRADAY_QUOTE = MappingProxyType({
+    "symbol": None,
+    "datatype": "json",
+    "function": "TIME_SERIES_INTRADAY",
+    "interval": "60min",
+    "slice": "year1month1",
+    "outputsize": "compact"
+})
+_DEFAULTS_INCOME_STATEMENT = MappingProxyType({
+    "function": "INCOME_STATEMENT",
+    "datatype": "json"
+})
+_DEFAULTS_CASH_FLOW = MappingProxyType({
+    "function": "CASH_FLOW",
+    "datatype": "json"
+})
+_DEFAULTS_EARNINGS = MappingProxyType({
+    "function": "EARNINGS",
+    "datatype": "json"
+})
+_DEFAULTS_COMPANY_OVERVIEW = MappingProxyType({
+    "function": "OVERVIEW"
+})
+_DEFAULTS_CRYPTO_INTRADAY = MappingProxyType({
+    "function": "CRYPTO_INTRADAY",
+    "interval": "5min",
+    "market": "USD",
+    "outputsize": "compact"
+})
+_DEFAULTS_REAL_GDP = MappingProxyType({
+    "function": "REAL_GDP",
+    "interval": "annual",
+    "datatype": "json"
+})
+_DEFAULTS_TECHNICAL_INDICATOR = MappingProxyType({
+    "function": "SMA",
+    "interval": "monthly",
+    "datatype": "json"
+})
+
+
+# keys the client adds to every response, any other key carries data from alpha vantage
+_RESPONSE_STATUS_KEYS = frozenset(("success", "limit_reached", "status_code", "Error Message", "symbol", "csv"))
+
+
+def _is_cacheable(requested_data: dict) -> bool:
+    """Only a 200 carrying data is cached, anything else would be replayed as a success for the whole ttl
+
+    Args:
+        requested_data (dict): The dictionary built by ``AlphavantageClient.get_data_from_alpha_vantage``
+
+    Returns:
+        :rtype: bool
+    """
+    if not requested_data['success'] or requested_data['status_code'] != 200:
+        return False
+
+    return bool(requested_data.get('csv')) or any(key not in _RESPONSE_STATUS_KEYS for key in requested_data)
+
 
 class ApiKeyNotFound(Exception):
 
@@ -14,57 +88,70 @@ class ApiKeyNotFound(Exception):
         super().__init__(message)
 
 
-class AlphavantageClient:
-    def __init__(self):
-        # try to get api key from USER_PROFILE/.alphavantage
-        alphavantage_config_file_path = f'{os.path.expanduser("~")}{os.path.sep}.alphavantage'
-        msg = {"method": "__init__", "action": f"{alphavantage_config_file_path} config file found"}
-        if os.path.exists(alphavantage_config_file_path):
-            logging.info(json.dumps(msg))
-            config = configparser.ConfigParser()
-            config.read(alphavantage_config_file_path)
-            self.__api_key__ = config['access']['api_key']
-            return
-        # try to get from an environment variable
-        elif os.environ.get('ALPHAVANTAGE_API_KEY') is not None:
-            self.__api_key__ = os.environ.get('ALPHAVANTAGE_API_KEY')
-            msg["action"] = f"api key found from environment"
-            logging.info(json.dumps(msg))
-            return
-        else:
-            self.__api_key__ = ""
-
-    def __build_url_from_args__(self, event: dict):
-        """
+@functools.lru_cache(maxsize=1)
+def _load_api_key() -> str:
+    """Find the api key in ~/.alphavantage or the ALPHAVANTAGE_API_KEY environment variable
 
-        Args:
-            event:
+    The result is cached so building more clients doesn't read and parse the config file again. Call
+    ``_load_api_key.cache_clear()`` to force a re-read.
 
-        Returns:
-            :rtype: str
-        """
-        url = f'https://www.alphavantage.co/query?'
-        # build url from event
-        for property in event:
-            url += f'{property}={event[property]}&'
-        url = url[:-1]
-        return url
-
-    def __inject_values__(self, default_values: dict, dest_obj: dict):
-        """
+    Returns:
+        :rtype: str
+    """
+    # try to get api key from USER_PROFILE/.alphavantage
+    msg = {"method": "__init__", "action": f"{_ALPHAVANTAGE_CONFIG_PATH} config file found"}
+    if os.path.exists(_ALPHAVANTAGE_CONFIG_PATH):
+        logger.info(dumps(msg))
+        config = configparser.ConfigParser()
+        config.read(_ALPHAVANTAGE_CONFIG_PATH)
+        return config['access']['api_key']
+    # try to get from an environment variable
+    elif os.environ.get('ALPHAVANTAGE_API_KEY') is not None:
+        msg["action"] = f"api key found from environment"
+        logger.info(dumps(msg))
+        return os.environ.get('ALPHAVANTAGE_API_KEY')
 
-        Args:
-            default_values:
-            dest_obj:
+    return ""
 
-        Returns:
-            :rtype: None
 
-        """
-        # inject defaults for missing values
-        for default_key in default_values:
-            if default_key not in dest_obj or dest_obj[default_key] is None:
-                dest_obj[default_key] = default_values[default_key]
+# http statuses retried by the session, with a rate limiter 429 is left to the limiter
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+_RATE_LIMITED_RETRY_STATUSES = (500, 502, 503, 504)
+
+
+def _create_session(retry_statuses: tuple = _RETRY_STATUSES) -> requests.Session:
+    """Build the pooled http session shared by every client instance.
+
+    Every call goes to the same host, so keeping the connection alive avoids a new TCP + TLS handshake per request.
+    Transient failures (rate limiting, server errors) are retried with a small backoff, when they persist the last
+    response is returned (``success=False`` with its ``status_code``) instead of raising ``RetryError``.
+    Args:
+        retry_statuses (tuple): The http statuses to retry
+
+    Returns:
+        :rtype: requests.Session
+    """
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=retry_statuses, raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.headers.update({"Accept-Encoding": "gzip", "Connection": "keep-alive"})
+
+    return session
+
+
+class AlphavantageClient:
+    __slots__ = ("__api_key__", "_cache", "_limiter")
+    _base_url = "https://www.alphavantage.co/query"
+    _session = _create_session()
+    # retrying a 429 would send requests outside the spacing of with_rate_limit, so rate limited clients don't
+    _rate_limited_session = _create_session(_RATE_LIMITED_RETRY_STATUSES)
+    _timeout = (3.05, 27)  # (connect, read) seconds
+
+    def __init__(self):
+        self.__api_key__ = _load_api_key()
+        self._cache = None
+        self._limiter = None
 
     def __create_api_request_from__(self, defaults: dict, event: dict):
         """
@@ -76,11 +163,31 @@ class AlphavantageClient:
         Returns:
             :rtype: dict
         """
-        json_request = event.copy()
-        self.__inject_values__(defaults, json_request)
+        json_request = {**defaults, **event}
+        # the event can explicitly pass None, fall back to the default for those
+        for default_key, default_value in defaults.items():
+            if json_request[default_key] is None:
+                json_request[default_key] = default_value
 
         return json_request
 
+    def __create_model_from__(self, model, json_response: dict, validate: bool):
+        """
+
+        Args:
+            model: The pydantic model class to build
+            json_response: The dictionary returned by ``get_data_from_alpha_vantage``
+            validate: When ``False`` the response is trusted and pydantic validation is skipped
+
+        Returns:
+            An instance of ``model``
+        """
+        # errors and rate limit notes only carry the base fields, there is nothing to validate
+        if validate and json_response['success']:
+            return model.parse_obj(json_response)
+
+        return model.from_trusted(json_response)
+
     def with_api_key(self, api_key: str):
         """Specify the API Key when you are storing it somewhere other than in ini file or environment variable
 
@@ -97,7 +204,38 @@ class AlphavantageClient:
 
         return self
 
-    def get_global_quote(self, event: dict) -> GlobalQuote:
+    def with_response_cache(self, cache: ResponseCache = None):
+        """Answer repeated requests from a local cache until they expire
+
+        Successful responses are stored with a time to live based on the ``function`` requested (i.e. a day for
+        fundamentals, a minute for intraday quotes), so repeated calls skip the network.
+        Args:
+            cache (ResponseCache): The cache to use. Defaults to ``ResponseCache()`` stored in ~/.alphavantage_cache
+
+        Returns:
+            :rtype: AlphavantageClient
+        """
+        self._cache = cache if cache is not None else ResponseCache()
+
+        return self
+
+    def with_rate_limit(self, requests_per_minute: int):
+        """Throttle requests so parallel calls don't exceed the quota of your api key
+
+        Requests sent through this client (i.e. ``get_many_global_quotes`` or ``asyncio.gather``) are spaced evenly
+        to stay within ``requests_per_minute`` instead of coming back with limit_reached. A 429 (too many requests)
+        is returned as is instead of being retried, server errors (5xx) are still retried without waiting for a slot.
+        Args:
+            requests_per_minute (int): The quota of your api key (i.e. 5 for free keys)
+
+        Returns:
+            :rtype: AlphavantageClient
+        """
+        self._limiter = RateLimiter(requests_per_minute)
+
+        return self
+
+    def get_global_quote(self, event: dict, validate: bool = False) -> GlobalQuote:
         """ Lightweight access to obtain stock quote data
 
         A lightweight alternative to the time series APIs, this service returns the price and volume information
@@ -105,20 +243,35 @@ class AlphavantageClient:
         Args:
             event (dict): A ``dict`` containing the paramters supported by the api.
             Minimum required value is ``symbol (str)``
+            validate (bool): Run pydantic validation on the response instead of trusting it. Defaults to ``False``
 
         Returns:
             :rtype: GlobalQuote
 
         """
-        defaults = {
-            "function": "GLOBAL_QUOTE"
-        }
-        json_request = self.__create_api_request_from__(defaults, event)
+        json_request = self.__create_api_request_from__(_DEFAULTS_GLOBAL_QUOTE, event)
         json_response = self.get_data_from_alpha_vantage(json_request)
 
-        return GlobalQuote.parse_obj(json_response)
+        return self.__create_model_from__(GlobalQuote, json_response, validate)
 
-    def get_intraday_quote(self, event: dict) -> Quote:
+    def get_many_global_quotes(self, symbols: list, max_workers: int = 8, *, validate: bool = False) -> list:
+        """ Obtain the stock quote data for many symbols at once
+
+        The requests run concurrently on a thread pool and share the client's keep-alive connection pool, instead of
+        one round trip after another. Check ``limit_reached`` on each quote when your api key has a low quota.
+        Args:
+            symbols (list): The ``str`` symbols to quote
+            max_workers (int): Maximum number of requests in flight at the same time
+            validate (bool): Run pydantic validation on the response instead of trusting it. Defaults to ``False``
+
+        Returns:
+            :rtype: list[GlobalQuote] in the same order as ``symbols``
+
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda symbol: self.get_global_quote({"symbol": symbol}, validate), symbols))
+
+    def get_intraday_quote(self, event: dict, validate: bool = False) -> Quote:
         """ Intraday time series data covering extened trading hours.
 
         This API returns intraday time series of the equity specified, covering extended trading hours where applicable
@@ -130,21 +283,18 @@ class AlphavantageClient:
         Args:
             event (dict): A Dictionary of parameters that will be passed to the api.
             Minimum required is ``symbol`` = ``str``
+            validate (bool): Run pydantic validation on the response instead of trusting it. Defaults to ``False``
 
         Returns:
             :rtype: Quote
 
         """
-        # default params
-        defaults = {"symbol": None, "datatype": "json", "function": "TIME_SERIES_INTRADAY",
-                    "interval": "60min", "slice": "year1month1",
-                    "outputsize": "compact"}
-        json_request = self.__create_api_request_from__(defaults, event)
+        json_request = self.__create_api_request_from__(_DEFAULTS_INTRADAY_QUOTE, event)
         json_response = self.get_data_from_alpha_vantage(json_request)
 
-        return Quote.parse_obj(json_response)
+        return self.__create_model_from__(Quote, json_response, validate)
 
-    def get_income_statement(self, event: dict) -> AccountingReport:
+    def get_income_statement(self, event: dict, validate: bool = False) -> AccountingReport:
         """
         This API returns the annual and quarterly income statements for the company of interest, with
         normalized fields mapped to GAAP and IFRS taxonomies of the SEC. Data is generally refreshed on the same day
@@ -153,24 +303,20 @@ class AlphavantageClient:
         Args:
             event (dict): A Dictionary of parameters that will be passed to the api.
             Minimum required is ``symbol`` = ``str``
+            validate (bool): Run pydantic validation on the response instead of trusting it. Defaults to ``False``
 
         Returns:
             :rtype: AccountingReport
 
         """
-
-        defaults = {
-            "function": "INCOME_STATEMENT",
-            "datatype": "json"
-        }
         if event.get("datatype") == "csv":
-            raise CsvNotSupported(defaults.get("function"), event)
-        json_request = self.__create_api_request_from__(defaults, event)
+            raise CsvNotSupported(_DEFAULTS_INCOME_STATEMENT.get("function"), event)
+        json_request = self.__create_api_request_from__(_DEFAULTS_INCOME_STATEMENT, event)
         json_response = self.get_data_from_alpha_vantage(json_request)
 
-        return AccountingReport.parse_obj(json_response)
+        return self.__create_model_from__(AccountingReport, json_response, validate)
 
-    def get_cash_flow(self, event: dict) -> AccountingReport:
+    def get_cash_flow(self, event: dict, validate: bool = False) -> AccountingReport:
         """
         This API returns the annual and quarterly cash flow for the company of interest, with normalized fields
         mapped to GAAP and IFRS taxonomies of the SEC. Data is generally refreshed on the same day a company reports
@@ -178,23 +324,20 @@ class AlphavantageClient:
         Args:
             event (dict): A Dictionary of parameters that will be passed to the api.
             Minimum required is ``symbol`` = ``str``
+            validate (bool): Run pydantic validation on the response instead of trusting it. Defaults to ``False``
 
         Returns:
             :rtype: AccountingReport
 
         """
-        defaults = {
-            "function": "CASH_FLOW",
-            "datatype": "json"
-        }
         if event.get("datatype") == "csv":
-            raise CsvNotSupported(defaults.get("function"), event)
-        json_request = self.__create_api_request_from__(defaults, event)
+            raise CsvNotSupported(_DEFAULTS_CASH_FLOW.get("function"), event)
+        json_request = self.__create_api_request_from__(_DEFAULTS_CASH_FLOW, event)
         json_response = self.get_data_from_alpha_vantage(json_request)
 
-        return AccountingReport.parse_obj(json_response)
+        return self.__create_model_from__(AccountingReport, json_response, validate)
 
-    def get_earnings(self, event: dict) -> AccountingReport:
+    def get_earnings(self, event: dict, validate: bool = False) -> AccountingReport:
         """
         This API returns the annual and quarterly earnings (EPS) for the company of interest. Quarterly data also
         includes analyst estimates and surprise metrics.
@@ -202,23 +345,20 @@ class AlphavantageClient:
         Args:
             event (dict): A Dictionary of parameters that will be passed to the api.
             Minimum required is ``symbol`` = ``str``
+            validate (bool): Run pydantic validation on the response instead of trusting it. Defaults to ``False``
 
         Returns:
             :rtype: AccountingReport
 
         """
-        defaults = {
-            "function": "EARNINGS",
-            "datatype": "json"
-        }
         if event.get("datatype") == "csv":
-            raise CsvNotSupported(defaults.get("function"), event)
-        json_request = self.__create_api_request_from__(defaults, event)
+            raise CsvNotSupported(_DEFAULTS_EARNINGS.get("function"), event)
+        json_request = self.__create_api_request_from__(_DEFAULTS_EARNINGS, event)
         json_response = self.get_data_from_alpha_vantage(json_request)
 
-        return AccountingReport.parse_obj(json_response)
+        return self.__create_model_from__(AccountingReport, json_response, validate)
 
-    def get_company_overview(self, event: dict) -> CompanyOverview:
+    def get_company_overview(self, event: dict, validate: bool = False) -> CompanyOverview:
         """
         This API returns the company information, financial ratios, and other key metrics for the equity specified.
         Data is generally refreshed on the same day a company reports its latest earnings and financials.
@@ -226,22 +366,20 @@ class AlphavantageClient:
         Args:
             event (dict): A Dictionary of parameters that will be passed to the api.
             Minimum required is ``symbol`` = ``str``
+            validate (bool): Run pydantic validation on the response instead of trusting it. Defaults to ``False``
 
         Returns:
             Return a CompanyOverview Object
 
         """
-        defaults = {
-            "function": "OVERVIEW"
-        }
         if event.get("datatype") == "csv":
-            raise CsvNotSupported(defaults.get("function"), event)
-        json_request = self.__create_api_request_from__(defaults, event)
+            raise CsvNotSupported(_DEFAULTS_COMPANY_OVERVIEW.get("function"), event)
+        json_request = self.__create_api_request_from__(_DEFAULTS_COMPANY_OVERVIEW, event)
         json_response = self.get_data_from_alpha_vantage(json_request)
 
-        return CompanyOverview.parse_obj(json_response)
+        return self.__create_model_from__(CompanyOverview, json_response, validate)
 
-    def get_crypto_intraday(self, event: dict) -> Quote:
+    def get_crypto_intraday(self, event: dict, validate: bool = False) -> Quote:
         """
         This API returns intraday time series (timestamp, open, high, low, close, volume) of the cryptocurrency
         specified, updated realtime.
@@ -249,65 +387,52 @@ class AlphavantageClient:
         Args:
             event (dict): A Dictionary of parameters that will be passed to the api.
             Minimum required is ``symbol`` = (``str``)
+            validate (bool): Run pydantic validation on the response instead of trusting it. Defaults to ``False``
 
         Returns:
             :rtype: Quote
 
         """
-        defaults = {
-            "function": "CRYPTO_INTRADAY",
-            "interval": "5min",
-            "market": "USD",
-            "outputsize": "compact"
-        }
-        json_request = self.__create_api_request_from__(defaults, event)
+        json_request = self.__create_api_request_from__(_DEFAULTS_CRYPTO_INTRADAY, event)
         json_response = self.get_data_from_alpha_vantage(json_request)
 
-        return Quote.parse_obj(json_response)
+        return self.__create_model_from__(Quote, json_response, validate)
 
-    def get_real_gdp(self, event: dict={}) -> RealGDP:
+    def get_real_gdp(self, event: dict = {}, validate: bool = False) -> RealGDP:
         """
 
         This API returns the annual and quarterly Real GDP of the United States.
 
         Args:
             event (dict): Not required. You can pass in any parameters supported by the api
+            validate (bool): Run pydantic validation on the response instead of trusting it. Defaults to ``False``
 
         Returns:
             :rtype: RealGDP
 
         """
-        defaults = {
-            "function": "REAL_GDP",
-            "interval": "annual",
-            "datatype": "json"
-        }
-        json_request = self.__create_api_request_from__(defaults, event)
+        json_request = self.__create_api_request_from__(_DEFAULTS_REAL_GDP, event)
         json_response = self.get_data_from_alpha_vantage(json_request)
 
-        return RealGDP.parse_obj(json_response)
+        return self.__create_model_from__(RealGDP, json_response, validate)
 
-    def get_technical_indicator(self, event: dict) -> Quote:
+    def get_technical_indicator(self, event: dict, validate: bool = False) -> Quote:
         """
         Default technical indicator is SMA. You can change this by passing in ``function`` = ``[your indicator]``
 
         Args:
             event (dict): Parameters supported by the API
+            validate (bool): Run pydantic validation on the response instead of trusting it. Defaults to ``False``
 
         Returns:
             :rtype: Quote
 
         """
-        defaults = {
-            "function": "SMA",
-            "interval": "monthly",
-            "datatype": "json"
-        }
-        json_request = self.__create_api_request_from__(defaults, event)
+        json_request = self.__create_api_request_from__(_DEFAULTS_TECHNICAL_INDICATOR, event)
         json_response = self.get_data_from_alpha_vantage(json_request)
         json_response["indicator"] = event.get("function")
 
-        return Quote.parse_obj(json_response)
+        return self.__create_model_from__(Quote, json_response, validate)
 
     def get_data_from_alpha_vantage(self, event: dict) -> dict:
         """
@@ -321,6 +446,34 @@ class AlphavantageClient:
             :rtype: dict
 
         """
+        checks, loggable_event = self.__prepare_request__(event)
+        if self._cache is not None:
+            cached_response = self._cache.get(loggable_event)
+            if cached_response is not None:
+                return cached_response
+
+        # fetch data from API
+        session = self._session
+        if self._limiter is not None:
+            self._limiter.acquire()
+            session = self._rate_limited_session
+        r = session.get(self._base_url, params=event, timeout=self._timeout)
+        requested_data = self.__build_response__(checks, r, event, loggable_event)
+        if self._cache is not None and _is_cacheable(requested_data):
+            self._cache.put(loggable_event, requested_data)
+
+        return requested_data
+
+    def __prepare_request__(self, event: dict):
+        """
+        Inject the api key into the event and pick the validation rules for the requested datatype
+
+        Args:
+            event (dict): The url parameters supported by the web api
+
+        Returns:
+            :rtype: tuple
+        """
         checks = ValidationRuleChecks().from_customer_request(event)
         # get api key if not provided
         if checks.expect_api_key_in_event().failed():
@@ -331,16 +484,29 @@ class AlphavantageClient:
                 "You must call client.with_api_key([api_key]), create config file in your profile (i.e. ~/.alphavantage) or event[api_key] = [your api key] before retrieving data from alphavantage")
 
         # create a version of the event without api key
-        loggable_event = copy.deepcopy(event)
-        loggable_event.pop("apikey")
+        loggable_event = {key: value for key, value in event.items() if key != "apikey"}
 
-        # fetch data from API
-        url = self.__build_url_from_args__(event)
-        r = requests.get(url)
+        return checks, loggable_event
+
+    def __build_response__(self, checks, r, event: dict, loggable_event: dict) -> dict:
+        """
+        Convert the http response from alphavantage into the dictionary returned by ``get_data_from_alpha_vantage``
+
+        Args:
+            checks: The validation rules created by ``__prepare_request__``
+            r: The http response from alphavantage
+            event (dict): The url parameters sent to the web api
+            loggable_event (dict): The url parameters without the api key
+
+        Returns:
+            :rtype: dict
+        """
         checks.with_response(r)
         requested_data = {}
-        logging.info(json.dumps({"method": "get_data_from_alpha_vantage", "action": "response_from_alphavantage"
-                                    , "status_code": r.status_code, "data": r.text, "event": loggable_event}))
+        log_enabled = logger.isEnabledFor(logging.INFO)  # skip serializing large payloads nobody will see
+        if log_enabled:
+            logger.info(dumps({"method": "get_data_from_alpha_vantage", "action": "response_from_alphavantage"
+                                  , "status_code": r.status_code, "data_len": len(r.content), "event": loggable_event}))
         # verify request worked correctly and build response
         # gotta check if consumer request json or csv, so we can parse the output correctly
         requested_data['success'] = checks.expect_successful_response().passed()  # successful csv response
@@ -349,18 +515,20 @@ class AlphavantageClient:
         requested_data['limit_reached'] = checks.expect_limit_not_reached().passed()
         requested_data['status_code'] = checks.get_status_code()
 
-        if checks.expect_json_datatype().expect_successful_response().passed():  # successful json response
+        # errors and rate limit notes carry no data, so only a successful response is parsed
+        if requested_data['success'] and checks.expect_json_datatype().passed():  # successful json response
             json_response = checks.get_obj()
             for field in json_response:
                 requested_data[field] = json_response[field]
 
-        if checks.expect_csv_datatype().expect_successful_response().passed():  # successful csv response
+        if requested_data['success'] and checks.expect_csv_datatype().passed():  # successful csv response
             requested_data['csv'] = checks.get_obj()
 
         # not all calls will have symbol in the call to alphavantage.... if so we can to capture it.
         if "symbol" in event:
             requested_data['symbol'] = event['symbol']
-        logging.info(json.dumps({"method": "get_data_from_alpha_vantage"
-                                    , "action": "return_value", "data": requested_data, "event": loggable_event}))
+        if log_enabled:
+            logger.info(dumps({"method": "get_data_from_alpha_vantage"
+                                  , "action": "return_value", "data": requested_data, "event": loggable_event}))
 
         return requested_data
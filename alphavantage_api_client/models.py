@@ -1,7 +1,7 @@
 import pydantic
 from pydantic import BaseModel, Field
 from typing import Optional
-import copy
+import functools
 
 
 class CsvNotSupported(Exception):
@@ -11,6 +11,25 @@ class CsvNotSupported(Exception):
         super().__init__(self.message)
 
 
+# response keys holding the time series / technical analysis of a Quote, renamed to ``data``
+_DATA_KEY_PREFIXES = ("Technical Analysis: ", "Time Series (", "Time Series Crypto (")
+
+
+@functools.lru_cache(maxsize=None)
+def _field_aliases(model) -> dict:
+    """ Maps each response key (alias) of the model to the field names it populates, built once per model class """
+    aliases = {}
+    for name, field in model.__fields__.items():
+        aliases[field.alias] = aliases.get(field.alias, ()) + (name,)
+    return aliases
+
+
+@functools.lru_cache(maxsize=None)
+def _required_fields(model) -> tuple:
+    """ Names of the fields without a default, looked up once per model class """
+    return tuple(name for name, field in model.__fields__.items() if field.required)
+
+
 class BaseResponse(BaseModel):
     success: bool
     limit_reached: bool
@@ -18,6 +37,40 @@ class BaseResponse(BaseModel):
     error_message: Optional[str] = Field(None, alias='Error Message')
     csv: Optional[str]
 
+    class Config:
+        # responses nested in other models (i.e. a user's portfolio model) are reused instead of copied on validation
+        copy_on_model_validation = 'none'
+
+    @classmethod
+    def from_trusted(cls, data: dict):
+        """Build the model from a response produced by the client without running validation
+
+        Alpha vantage responses already have the expected types, so only the key renames (``_rename_keys``) and the
+        alias mapping are applied before handing the values to ``construct``.
+        Args:
+            data (dict): The dictionary returned by ``AlphavantageClient.get_data_from_alpha_vantage``
+
+        Returns:
+            An instance of this model
+        """
+        values = cls._rename_keys(dict(data))
+        aliases = _field_aliases(cls)
+        fields = {}
+        for key, value in values.items():
+            for name in aliases.get(key, ()):
+                fields[name] = value
+        fields_set = set(fields)
+        # construct fills the optional defaults, required fields missing from an error response become None
+        for name in _required_fields(cls):
+            fields.setdefault(name, None)
+
+        return cls.construct(_fields_set=fields_set, **fields)
+
+    @staticmethod
+    def _rename_keys(values: dict) -> dict:
+        """ Rename the response keys that don't match a field or alias, shared by validation and ``from_trusted`` """
+        return values
+
 
 class BaseQuote(BaseResponse):
     symbol: str
@@ -32,14 +85,61 @@ class Quote(BaseQuote):
 
     @pydantic.root_validator(pre=True)
     def normalize_fields(cls, values):
-        return {
-            "data" if k.startswith("Technical Analysis: ") or k.startswith("Time Series (")
-                      or k.startswith("Time Series Crypto (") else k: v for k, v in values.items()
-        }
+        return cls._rename_keys(values)
+
+    @staticmethod
+    def _rename_keys(values: dict) -> dict:
+        # alpha vantage sends exactly one time series / technical analysis key, rename it in place
+        for k in values:
+            if k.startswith(_DATA_KEY_PREFIXES):
+                values["data"] = values.pop(k)
+                break
+        return values
+
+    def get_most_recent_value(self) -> Optional[dict]:
+        """ The first (most recent) entry of ``data`` with its date in ``query_date``, None when there is no data """
+        try:
+            quote_date, quotes = next(iter(self.data.items()))
+        except StopIteration:
+            return None
+
+        return {**quotes, "query_date": quote_date}
+
 
 class GlobalQuote(BaseQuote):
     data: dict = Field({}, alias='Global Quote')
 
+    def get_data_value(self, field: str) -> Optional[str]:
+        """ The value of a ``Global Quote`` field (i.e. ``05. price``), None when it isn't present """
+        return self.data.get(field)
+
+    def get_open_price(self) -> Optional[str]:
+        return self.data.get("02. open")
+
+    def get_high_price(self) -> Optional[str]:
+        return self.data.get("03. high")
+
+    def get_low_price(self) -> Optional[str]:
+        return self.data.get("04. low")
+
+    def get_price(self) -> Optional[str]:
+        return self.data.get("05. price")
+
+    def get_volume(self) -> Optional[str]:
+        return self.data.get("06. volume")
+
+    def get_latest_trading_day(self) -> Optional[str]:
+        return self.data.get("07. latest trading day")
+
+    def get_previous_close_price(self) -> Optional[str]:
+        return self.data.get("08. previous close")
+
+    def get_change_in_price(self) -> Optional[str]:
+        return self.data.get("09. change")
+
+    def get_percentage_change(self) -> Optional[str]:
+        return self.data.get("10. change percent")
+
 
 class AccountingReport(BaseQuote):
     annualReports: list = Field(default=[], alias="annualReports")
@@ -47,20 +147,24 @@ class AccountingReport(BaseQuote):
 
     @pydantic.root_validator(pre=True)
     def normalize_fields(cls, values):
-        annual_report_fields = ["annualEarnings"]
-        quarterly_report_fields = ["quarterlyEarnings"]
-        new_values = copy.deepcopy(values)
-        for field in new_values:
-            new_field = field
-            if field in annual_report_fields:
-                new_field = "annualReports"
-            elif field in quarterly_report_fields:
-                new_field = "quarterlyReports"
-            if new_field != field:
-                values[new_field] = values[field]
-                values.pop(field)
+        return cls._rename_keys(values)
+
+    @staticmethod
+    def _rename_keys(values: dict) -> dict:
+        if "annualEarnings" in values:
+            values["annualReports"] = values.pop("annualEarnings")
+        if "quarterlyEarnings" in values:
+            values["quarterlyReports"] = values.pop("quarterlyEarnings")
         return values
 
+    def get_most_recent_annual_report(self) -> Optional[dict]:
+        """ The first (most recent) annual report, None when there are no reports """
+        return self.annualReports[0] if self.annualReports else None
+
+    def get_most_recent_quarterly_report(self) -> Optional[dict]:
+        """ The first (most recent) quarterly report, None when there are no reports """
+        return self.quarterlyReports[0] if self.quarterlyReports else None
+
 
 class RealGDP(BaseResponse):
     name: Optional[str]
@@ -108,7 +212,7 @@ class CompanyOverview(BaseQuote):
     price_to_book_ratio: str = Field(default=None, alias='PriceToBookRatio')
     ev_to_revenue: str = Field(default=None, alias='EVToRevenue')
     ev_to_ebitda: str = Field(default=None, alias='EVToEBITDA')
-    beta: str = Field(default=None, alias='52WeekHigh')
+    beta: str = Field(default=None, alias='Beta')
     fifty_two_week_high: str = Field(default=None, alias='52WeekHigh')
     fifty_two_week_low: str = Field(default=None, alias='52WeekLow')
     fifty_day_moving_average: str = Field(default=None, alias='50DayMovingAverage')
@@ -0,0 +1,53 @@
+import threading
+import time
+from typing import Callable
+
+
+class RateLimiter:
+    """Spaces requests evenly so parallel calls stay within the api key's requests per minute
+
+    Each call reserves the next free slot under a lock and then waits for it, so the same limiter can be shared by
+    threads (``acquire``) and coroutines (``acquire_async``).
+    """
+
+    def __init__(self, requests_per_minute: int, clock: Callable[[], float] = time.monotonic):
+        """
+
+        Args:
+            requests_per_minute (int): The quota of your api key (i.e. 5 for free keys, 75, 150, 300, ...)
+            clock (Callable): Returns the current time in seconds. Defaults to ``time.monotonic``, tests can pass a
+            fake clock to check the spacing without waiting
+        """
+        if requests_per_minute is None or requests_per_minute <= 0:
+            raise ValueError(f"requests_per_minute must be greater than zero, received {requests_per_minute}")
+        self.__interval__ = 60.0 / requests_per_minute
+        self.__next_slot__ = 0.0
+        self.__lock__ = threading.Lock()
+        self.__clock__ = clock
+
+    def reserve(self) -> float:
+        """Reserve the next slot
+
+        Returns:
+            :rtype: float seconds to wait before sending the request
+        """
+        with self.__lock__:
+            now = self.__clock__()
+            slot = max(now, self.__next_slot__)
+            self.__next_slot__ = slot + self.__interval__
+
+        return slot - now
+
+    def acquire(self):
+        """ Block the current thread until a request may be sent """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        """ Wait without blocking the event loop until a request may be sent """
+        import asyncio  # only needed by async callers, keeps it out of the synchronous client's import time
+
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
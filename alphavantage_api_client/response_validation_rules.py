@@ -1,12 +1,19 @@
+from .serialization import loads
+
+
 class BaseValidationRuleChecks:
 
     def __init__(self):
         self.__http_get_response__ = None
+        self.__json_response__ = None
+        self.__json_invalid__ = False
         self.__customer_event_request__ = None
         self.__rules__ = {}
 
     def with_response(self, http_response):
         self.__http_get_response__ = http_response
+        self.__json_response__ = None
+        self.__json_invalid__ = False
 
         return self
 
@@ -18,6 +25,21 @@ class BaseValidationRuleChecks:
     def get_obj(self):  # assume csv or non json
         return self.__http_get_response__.text
 
+    def get_json(self):  # parse the body once, every rule reuses it
+        if self.__json_response__ is None:
+            try:
+                self.__json_response__ = loads(self.__http_get_response__.content)
+            except ValueError:  # i.e. an html error page from a proxy when the service is down
+                self.__json_response__ = {}
+                self.__json_invalid__ = True
+
+        return self.__json_response__
+
+    def is_json_object(self):  # the body parsed to a non empty json object, not just an empty placeholder
+        json_response = self.get_json()
+
+        return not self.__json_invalid__ and isinstance(json_response, dict) and len(json_response) > 0
+
     def check_response_present(self):
         pass
 
@@ -48,7 +70,7 @@ class BaseValidationRuleChecks:
     def expect_successful_response(self):
         self.check_response_present()
         rule_name = "expect_successful_response"
-        if self.is_meaningful_response():
+        if self.__http_get_response__.status_code == 200 and self.is_meaningful_response():
             self.__rules__[rule_name] = True
         else:
             self.__rules__[rule_name] = False
@@ -107,18 +129,20 @@ class BaseValidationRuleChecks:
         return self
 
     def get_error_message(self):
-        json_response = self.__http_get_response__.json()
+        if self.__http_get_response__.status_code != 200:
+            return self.__http_get_response__.text  # the service failed, give them what came back from the server
+        json_response = self.get_json()
         if len(json_response) == 0:
             return "Symbol not found"
         return json_response.get("Error Message", "Unknown")
 
     def get_note_message(self):
-        json_response = self.__http_get_response__.json()
+        json_response = self.get_json()
 
         return json_response.get("Note", "Unknown")
 
     def get_information_message(self):
-        json_response = self.__http_get_response__.json()
+        json_response = self.get_json()
 
         return json_response.get("Information", "Unknown")
 
@@ -138,22 +162,28 @@ class JsonValidationRuleChecks(BaseValidationRuleChecks):
 
     def expect_limit_not_reached(self):
         rule_name = "has_not_reached_limit"
-        response = self.__http_get_response__.json()
+        response = self.get_json()
         self.__rules__[rule_name] = "Note" in response and " calls per minute " in response["Note"]
 
         return self
 
+    def is_meaningful_response(self):  # work on the raw bytes, decoding .text allocates a copy of the body
+        content = self.__http_get_response__.content
+        return len(content) > 0 and b"Error Message" not in content and content != b"{}"
+
     def is_empty_global_quote(self, response_json):
         return len(response_json) == 1 and len(response_json.get("Global Quote", {})) == 0
 
     def expect_successful_response(self):
         self.check_response_present()
         rule_name = "expect_meaningful_json_response"
-        if self.is_meaningful_response() and self.__http_get_response__.text != "{}" \
-                and "Error Message" not in self.__http_get_response__.json() \
-                and "Information" not in self.__http_get_response__.json() \
-                and "Note" not in self.__http_get_response__.json() \
-                and not self.is_empty_global_quote(self.__http_get_response__.json()):
+        if self.__http_get_response__.status_code == 200 \
+                and self.is_meaningful_response() \
+                and self.is_json_object() \
+                and "Error Message" not in self.get_json() \
+                and "Information" not in self.get_json() \
+                and "Note" not in self.get_json() \
+                and not self.is_empty_global_quote(self.get_json()):
             self.__rules__[rule_name] = True
         else:
             self.__rules__[rule_name] = False
@@ -161,8 +191,12 @@ class JsonValidationRuleChecks(BaseValidationRuleChecks):
         return self
 
     def get_error_message(self):
-        json_response = self.__http_get_response__.json()
-        if len(json_response) == 0:
+        if self.__http_get_response__.status_code != 200:
+            return self.__http_get_response__.text  # the service failed, give them what came back from the server
+        json_response = self.get_json()
+        if self.__json_invalid__:
+            return self.__http_get_response__.text  # not json, i.e. an html page from a proxy
+        elif len(json_response) == 0:
             return "Symbol not found"
         elif "Error Message" in json_response:
             return json_response["Error Message"]
@@ -170,7 +204,7 @@ class JsonValidationRuleChecks(BaseValidationRuleChecks):
             return self.__http_get_response__.text  # just give them what came back from the server
 
     def get_obj(self):
-        return self.__http_get_response__.json()
+        return self.get_json()
 
 
 class CsvValidationRuleChecks(BaseValidationRuleChecks):
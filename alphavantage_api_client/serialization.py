@@ -0,0 +1,36 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
+
+
+def loads(data):
+    """Parse a json document
+
+    Args:
+        data (bytes | str): The raw json document, usually the body of an http response
+
+    Returns:
+        The parsed json value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def dumps(obj) -> str:
+    """Serialize an object to a json string
+
+    Args:
+        obj: A json serializable object
+
+    Returns:
+        :rtype: str
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+
+    return json.dumps(obj)
@@ -14,6 +14,13 @@ client_version = subprocess.run(['git', 'describe', '--tags'],
 # The text of the README file
 README = (HERE / "README.md").read_text()
 
+# optionally compile the response models with cython (ALPHAVANTAGE_CYTHONIZE=1), pure python otherwise
+ext_modules = []
+if os.environ.get("ALPHAVANTAGE_CYTHONIZE") == "1":
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize("alphavantage_api_client/models.py", language_level=3)
+
 # assert "." in alphavantage_api_client_version
 # assert os.path.isfile("alphavantage_api_client/version.py")
 # with open("alphavantage_api_client/VERSION","w", encoding="utf-8") as fh:
@@ -38,6 +45,8 @@ setup(
     packages=setuptools.find_packages(),
     py_modules=["alphavantage_api_client"],
     include_package_data=True,
-    install_requires=["requests","pydantic"],
+    ext_modules=ext_modules,
+    install_requires=["requests", "pydantic>=1.10,<2"],
+    extras_require={"async": ["httpx[http2]"], "fast": ["orjson"]},
     python_requires=">=3.7"
 )
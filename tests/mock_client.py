@@ -1,6 +1,6 @@
 import logging
 
-from alphavantage_api_client import AlphavantageClient
+from alphavantage_api_client import AlphavantageClient, AsyncAlphavantageClient
 import json
 import os
 from os.path import exists
@@ -70,3 +70,13 @@ class MockAlphavantageClient(AlphavantageClient):
         if "symbol" in event:
             json_response["symbol"] = event["symbol"]
         return json_response
+
+
+class MockAsyncAlphavantageClient(AsyncAlphavantageClient):
+
+    def __init__(self):
+        super().__init__()
+        self.mock_client = MockAlphavantageClient()
+
+    async def get_data_from_alpha_vantage(self, event, context=None):
+        return self.mock_client.get_data_from_alpha_vantage(event, context)
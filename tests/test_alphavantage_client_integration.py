@@ -2,7 +2,6 @@ import pytest
 import time
 from alphavantage_api_client import AlphavantageClient, CsvNotSupported
 import logging
-import json
 
 # https://intellij-support.jetbrains.com/hc/en-us/community/posts/360000218290-Configure-google-docstring
 # above is reference for setting google docstring in pycharm
@@ -22,12 +21,17 @@ def teardown_module(module):
     pass
 
 
+@pytest.fixture(scope="module")
+def client():
+    # free api keys allow 5 requests per minute, the shared limiter spaces the requests instead of sleeping in each test
+    return AlphavantageClient().with_rate_limit(5)
+
+
 @pytest.mark.integration
-def test_can_get_global_quote_json():
+def test_can_get_global_quote_json(client):
     event = {
         "symbol": "tsla"
     }
-    client = AlphavantageClient()
 
     global_quote = client.get_global_quote(event)
     assert global_quote.success, f"success was found to be {global_quote.success}: {global_quote.error_message}"
@@ -35,14 +39,12 @@ def test_can_get_global_quote_json():
     assert not global_quote.limit_reached, f"{global_quote.error_message}"
     assert len(global_quote.data) > 0, "Response should have data but contains zero"
     logging.warning(f" Can quote stock symbol in JSON {event.get('symbol', None)}")
-    time.sleep(20)
 
 @pytest.mark.integration
-def test_can_not_get_global_quote_json():
+def test_can_not_get_global_quote_json(client):
     event = {
         "symbol": "tsla2"
     }
-    client = AlphavantageClient()
 
     global_quote = client.get_global_quote(event)
     assert not global_quote.success, f"success was found to be {global_quote.success}: {global_quote.error_message}"
@@ -50,54 +52,47 @@ def test_can_not_get_global_quote_json():
     assert not global_quote.limit_reached, f"{global_quote.error_message}"
     assert not len(global_quote.data), "Response should have data but contains zero"
     logging.warning(f" Can Not quote stock symbol in JSON {event.get('symbol', None)}")
-    time.sleep(20)
 
 
 @pytest.mark.integration
-def test_can_get_global_quote_csv():
+def test_can_get_global_quote_csv(client):
     event = {
         "symbol": "tsla",
         "datatype": "csv"
     }
-    client = AlphavantageClient()
     global_quote = client.get_global_quote(event)
     assert global_quote.success, f"success was found to be {global_quote.success}: {global_quote.error_message}"
     assert global_quote.symbol == event.get("symbol"), "Response symbol doesn't matched requested symbol"
     assert not global_quote.limit_reached, f"{global_quote.error_message}"
     assert len(global_quote.csv) > 0, "Response should have data but contains zero"
     logging.warning(f" Can quote stock symbol in CSV {event.get('symbol', None)}")
-    time.sleep(20)
 
 
 @pytest.mark.integration
-def test_can_not_global_quote_wrong_symbol_json():
+def test_can_not_global_quote_wrong_symbol_json(client):
     event = {
         "symbol": "tsla2323"
     }
-    client = AlphavantageClient()
     global_quote = client.get_global_quote(event)
     assert not global_quote.success, f"success was found to be {global_quote.success}: {global_quote.error_message}"
     assert global_quote.symbol == event.get("symbol"), "Response symbol doesn't matched requested symbol"
     assert not global_quote.limit_reached, f"{global_quote.error_message}"
     assert not len(global_quote.data), "Response should have data but contains zero"
     logging.warning(f" Can NOT quote stock symbol in JSON {event.get('symbol', None)}")
-    time.sleep(20)
 
 
 @pytest.mark.integration
-def test_can_not_global_quote_wrong_symbol_csv():
+def test_can_not_global_quote_wrong_symbol_csv(client):
     event = {
         "symbol": "tsla2233",
         "datatype": "csv"
     }
-    client = AlphavantageClient()
     global_quote = client.get_global_quote(event)
     assert not global_quote.success, f"success was found to be {global_quote.success}: {global_quote.error_message}"
     assert global_quote.symbol == event.get("symbol"), "Response symbol doesn't matched requested symbol"
     assert not global_quote.limit_reached, f"{global_quote.error_message}"
     assert global_quote.csv is None, "Response should have data but contains zero"
     logging.warning(f" Can NOT quote stock symbol in csv {event.get('symbol', None)} : {global_quote.error_message}")
-    time.sleep(20)
 
 
 @pytest.mark.integration
@@ -147,39 +142,35 @@ def test_canReachLimitCsv():
 
 
 @pytest.mark.integration
-def test_can_quote_intraday():
+def test_can_quote_intraday(client):
     event = {
         "symbol": "TSLA",
         "interval": "5min"
     }
-    client = AlphavantageClient()
     intra_day_quote = client.get_intraday_quote(event)
     assert not intra_day_quote.limit_reached, f"limit_reached should not be true {intra_day_quote.error_message}"
     assert intra_day_quote.success, f"success is false {intra_day_quote.error_message}"
     assert len(intra_day_quote.data), f"Did not return data for this symbol {intra_day_quote.symbol}"
     logging.warning(f" Successfully quoted cryptocurrency symbol {event['symbol']} in JSON")
-    time.sleep(20)
 
 
 @pytest.mark.integration
-def test_can_quote_crypto():
+def test_can_quote_crypto(client):
     event = {
         "function": "CRYPTO_INTRADAY",
         "symbol": "ETH",
         "market": "USD",
         "interval": "5min"
     }
-    client = AlphavantageClient()
     results = client.get_crypto_intraday(event)
     assert not results.limit_reached, f"limit_reached should not be true {results.error_message}"
     assert results.success, f"success is false {results.error_message}"
     assert len(results.data), "Data{} property is empty but should have information"
     logging.warning(f" Successfully quoted cryptocurrency symbol {event['symbol']} in JSON")
-    time.sleep(20)
 
 
 @pytest.mark.integration
-def test_can_quote_crypto_csv():
+def test_can_quote_crypto_csv(client):
     event = {
         "function": "CRYPTO_INTRADAY",
         "symbol": "ETH",
@@ -187,46 +178,39 @@ def test_can_quote_crypto_csv():
         "interval": "5min",
         "datatype": "csv"
     }
-    client = AlphavantageClient()
     results = client.get_crypto_intraday(event)
     assert not results.limit_reached, f"limit_reached should not be true {results.error_message}"
     assert results.success, f"success is false {results.error_message}"
     assert len(results.csv), "Data{} property is empty but should have information"
     logging.warning(f" Successfully quoted cryptocurrency symbol {event['symbol']} in CSV")
-    time.sleep(20)
 
 
 @pytest.mark.integration
-def test_can_quote_real_gdp():
-
-    client = AlphavantageClient()
+def test_can_quote_real_gdp(client):
     real_gdp = client.get_real_gdp()
     assert not real_gdp.limit_reached, f"limit_reached is not present in results {real_gdp.error_message}"
     assert real_gdp.success, f"Success=False but expected true  {real_gdp.error_message}"
     assert len(real_gdp.data), "Data{} is empty but expected results"
     logging.warning(" Can quote Real GDP")
-    time.sleep(20)
 
 
 @pytest.mark.integration
-def test_can_quote_real_csv():
+def test_can_quote_real_csv(client):
     event = {
         "function": "REAL_GDP",
         "interval": "annual",
         "datatype": "csv"
     }
-    client = AlphavantageClient()
     real_gdp = client.get_real_gdp(event)
     assert not real_gdp.limit_reached, f"limit_reached is not present in results {real_gdp.error_message}"
     assert real_gdp.success, f"Success=False but expected true  {real_gdp.error_message}"
     assert real_gdp.data is None, "Data{} is empty but expected results"
     assert len(real_gdp.csv), "CSV data is not present"
     logging.warning(" Can quote Real GDP")
-    time.sleep(20)
 
 
 @pytest.mark.integration
-def test_can_quote_technical_indicator():
+def test_can_quote_technical_indicator(client):
     event = {
         "function": "EMA",
         "symbol": "IBM",
@@ -234,16 +218,14 @@ def test_can_quote_technical_indicator():
         "time_period": "10",
         "series_type": "open"
     }
-    client = AlphavantageClient()
     technical_indicator = client.get_technical_indicator(event)
     assert not technical_indicator.limit_reached, f"limit_reached is True {technical_indicator.error_message}"
     assert technical_indicator.success, f"Success is False {technical_indicator.error_message}"
     logging.warning(" Can quote IBM EMA technical indicator")
-    time.sleep(20)
 
 
 @pytest.mark.integration
-def test_can_quote_technical_indicator_csv():
+def test_can_quote_technical_indicator_csv(client):
     event = {
         "function": "EMA",
         "symbol": "IBM",
@@ -252,18 +234,15 @@ def test_can_quote_technical_indicator_csv():
         "series_type": "open",
         "datatype": "csv"
     }
-    client = AlphavantageClient()
     technical_indicator = client.get_technical_indicator(event)
     assert not technical_indicator.limit_reached, f"limit_reached is True {technical_indicator.error_message}"
     assert technical_indicator.success, f"Success is False {technical_indicator.error_message}"
     assert len(technical_indicator.csv), "Csv field is empty"
     logging.warning(" Can quote IBM EMA technical indicator")
-    time.sleep(20)
 
 
 @pytest.mark.integration
-def test_can_query_company_overview():
-    client = AlphavantageClient()
+def test_can_query_company_overview(client):
     event = {
         "symbol": "TSLA"
     }
@@ -274,12 +253,10 @@ def test_can_query_company_overview():
         "symbol"), f"Symbols are not equal {company_overview.symbol} : {event.get('symbol')}"
     assert not company_overview.limit_reached, "unexpected limit_reached"
     logging.warning(f" Can query company overview {event.get('symbol', None)}")
-    time.sleep(20)
 
 
 @pytest.mark.integration
-def test_can_not_quote_company_overview():
-    client = AlphavantageClient()
+def test_can_not_quote_company_overview(client):
     event = {
         "symbol": "TSLA2"
     }
@@ -290,13 +267,11 @@ def test_can_not_quote_company_overview():
         "symbol"), f"Symbols are equal {company_overview.symbol} : {event.get('symbol')} but shouldn't be"
     assert not company_overview.limit_reached, "unexpected limit_reached"
     logging.warning(f" Can not query company overview: {company_overview.error_message}")
-    time.sleep(20)
 
 
 @pytest.mark.integration
-def test_can_not_query_csv_company_overview():
+def test_can_not_query_csv_company_overview(client):
     with pytest.raises(CsvNotSupported):
-        client = AlphavantageClient()
         event = {
             "symbol": "tsla",
             "datatype": "csv"
@@ -305,8 +280,7 @@ def test_can_not_query_csv_company_overview():
 
 
 @pytest.mark.integration
-def test_can_not_query_income_statement():
-    client = AlphavantageClient()
+def test_can_not_query_income_statement(client):
     event = {
         "symbol": "tsla2"
     }
@@ -317,12 +291,10 @@ def test_can_not_query_income_statement():
     assert accounting_report.symbol == event.get("symbol", None), f"Symbols don't match " \
                                                                   f"{accounting_report.symbol} : {event.get('symbol')}"
     logging.warning(f" Can not query  income statement {accounting_report.error_message}")
-    time.sleep(20)
 
 
 @pytest.mark.integration
-def test_can_query_income_statement():
-    client = AlphavantageClient()
+def test_can_query_income_statement(client):
     event = {
         "symbol": "tsla"
     }
@@ -333,13 +305,11 @@ def test_can_query_income_statement():
     assert accounting_report.symbol == event.get("symbol", None), f"Symbols don't match " \
                                                                   f"{accounting_report.symbol} : {event.get('symbol')}"
     logging.warning(f" Can query  income statement {event.get('symbol', None)}")
-    time.sleep(20)
 
 
 @pytest.mark.integration
-def test_can_not_query_income_statement_csv():
+def test_can_not_query_income_statement_csv(client):
     with pytest.raises(CsvNotSupported):
-        client = AlphavantageClient()
         event = {
             "symbol": "tsla",
             "datatype": "csv"
@@ -348,8 +318,7 @@ def test_can_not_query_income_statement_csv():
 
 
 @pytest.mark.integration
-def can_query_earnings():
-    client = AlphavantageClient()
+def can_query_earnings(client):
     event = {
         "symbol": "tsla"
     }
@@ -361,12 +330,10 @@ def can_query_earnings():
     assert len(earnings.annualReports), "annualReports is empty"
     assert earnings.symbol == event.get("symbol"), f"Symbols not equal {earnings.symbol} : {event.get('symbol')}"
     logging.warning(f" Can query  earnings {event.get('symbol', None)}")
-    time.sleep(20)
 
 
 @pytest.mark.integration
-def test_can_query_income_statement():
-    client = AlphavantageClient()
+def test_can_query_income_statement(client):
     event = {
         "symbol": "tsla"
     }
@@ -376,12 +343,10 @@ def test_can_query_income_statement():
     assert income.symbol == event.get("symbol"), f"Symbols are not equal {income.symbol} : {event.get('symbol')}"
     assert not income.limit_reached, "limit_reached but should not have"
     logging.warning(f" Can query income statement {event.get('symbol', None)}")
-    time.sleep(20)
 
 
 @pytest.mark.integration
-def test_can_query_earnings():
-    client = AlphavantageClient()
+def test_can_query_earnings(client):
     event = {
         "symbol": "tsla"
     }
@@ -391,11 +356,9 @@ def test_can_query_earnings():
     assert not earnings.limit_reached, f"limit_reached is not present in results {earnings.error_message}"
     assert earnings.symbol == event.get("symbol"), f"Symbols not equal {earnings.symbol} : {event.get('symbol')}"
     logging.warning(f" Can query earnings {event.get('symbol', None)}")
-    time.sleep(20)
 
 @pytest.mark.integration
-def test_can_not_query_earnings():
-    client = AlphavantageClient()
+def test_can_not_query_earnings(client):
     event = {
         "symbol": "tsla22"
     }
@@ -405,13 +368,11 @@ def test_can_not_query_earnings():
     assert not earnings.limit_reached, f"limit_reached is not present in results {earnings.error_message}"
     assert earnings.symbol == event.get("symbol"), f"Symbols not equal {earnings.symbol} : {event.get('symbol')}"
     logging.warning(f" Can not query earnings: {earnings.error_message}")
-    time.sleep(20)
 
 
 @pytest.mark.integration
-def test_can_not_query_earnings_csv():
+def test_can_not_query_earnings_csv(client):
     with pytest.raises(CsvNotSupported):
-        client = AlphavantageClient()
         event = {
             "symbol": "tsla",
             "datatype": "csv"
@@ -420,8 +381,7 @@ def test_can_not_query_earnings_csv():
 
 
 @pytest.mark.integration
-def test_can_query_cash_flow():
-    client = AlphavantageClient()
+def test_can_query_cash_flow(client):
     event = {
         "symbol": "tsla"
     }
@@ -433,11 +393,9 @@ def test_can_query_cash_flow():
     assert len(cash_flow.annualReports), "annualReports is empty"
     assert len(cash_flow.quarterlyReports), "quarterlyReports are empty"
     logging.warning(f" Can query  cash flow {event.get('symbol', None)}")
-    time.sleep(20)
 
 @pytest.mark.integration
-def test_can_not_query_cash_flow():
-    client = AlphavantageClient()
+def test_can_not_query_cash_flow(client):
     event = {
         "symbol": "tsla22"
     }
@@ -449,12 +407,10 @@ def test_can_not_query_cash_flow():
     assert not len(cash_flow.annualReports), "annualReports are not empty"
     assert not len(cash_flow.quarterlyReports), "quarterlyReports are not empty"
     logging.warning(f" Can not query  cash flow {cash_flow.error_message}")
-    time.sleep(20)
 
 @pytest.mark.integration
-def test_can_not_query_cash_flow_csv():
+def test_can_not_query_cash_flow_csv(client):
     with pytest.raises(CsvNotSupported):
-        client = AlphavantageClient()
         event = {
             "symbol": "tsla",
             "datatype": "csv"
@@ -464,14 +420,12 @@ def test_can_not_query_cash_flow_csv():
 
 
 @pytest.mark.integration
-def test_get_data_from_alpha_vantage():
+def test_get_data_from_alpha_vantage(client):
     event = {
         "function": "EMA"
     }
-    client = AlphavantageClient()
     results = client.get_data_from_alpha_vantage(event)
     assert type(results) is dict, "Results object should be a dictionary"
     assert len(results) > 0, "There should be data in the results"
 
     logging.warning("Successfully queried data using get_data_from_alpha_vantage")
-    time.sleep(20)
@@ -0,0 +1,118 @@
+import asyncio
+import threading
+import requests
+import pytest
+from alphavantage_api_client import AsyncAlphavantageClient, ResponseCache
+from .mock_client import MockAsyncAlphavantageClient
+import logging
+
+
+@pytest.mark.unit
+def test_get_global_quote():
+    client = MockAsyncAlphavantageClient()
+    event = {
+        "symbol": "ibm"
+    }
+    global_quote = asyncio.run(client.get_global_quote(event))
+    assert global_quote.success, "Success field is missing or False"
+    assert not global_quote.limit_reached, "Limit reached is true but not hitting API"
+    assert global_quote.symbol == event["symbol"], "Symbol from results don't match event"
+    assert len(global_quote.data) > 0, "Data field is zero or not present"
+    logging.warning(f"Successfully tested async test_get_global_quote for {event['symbol']}")
+
+
+@pytest.mark.unit
+def test_get_many_symbols_concurrently():
+    client = MockAsyncAlphavantageClient()
+    symbols = ["ibm", "tsla", "msft"]
+
+    global_quotes = asyncio.run(client.get_many_global_quotes(symbols))
+    assert [global_quote.symbol for global_quote in global_quotes] == symbols, "Results are not in request order"
+    assert all(global_quote.success for global_quote in global_quotes), "Success field is missing or False"
+    logging.warning(f"Successfully tested async test_get_many_symbols_concurrently for {symbols}")
+
+
+@pytest.mark.unit
+def test_get_outside_async_with_raises():
+    client = AsyncAlphavantageClient().with_api_key("demo")
+    with pytest.raises(RuntimeError, match="async with"):
+        asyncio.run(client.get_global_quote({"symbol": "ibm"}))
+    logging.warning("Successfully tested async test_get_outside_async_with_raises")
+
+
+class ThreadRecordingCache(ResponseCache):
+    """ Remembers which threads read and wrote the cache """
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self.threads = []
+
+    def get(self, event: dict):
+        self.threads.append(threading.get_ident())
+        return super().get(event)
+
+    def put(self, event: dict, response: dict):
+        self.threads.append(threading.get_ident())
+        super().put(event, response)
+
+
+class StubHttpClient:
+    def __init__(self):
+        self.requests_sent = 0
+
+    async def get(self, url, params=None):
+        self.requests_sent += 1
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["content-type"] = "application/json"
+        response._content = b'{"Global Quote": {"01. symbol": "IBM", "05. price": "138.0000"}}'
+        return response
+
+
+@pytest.mark.unit
+def test_cache_runs_off_the_event_loop(tmp_path):
+    cache = ThreadRecordingCache(str(tmp_path / "cache"))
+    client = AsyncAlphavantageClient().with_api_key("demo").with_response_cache(cache)
+    client._client = StubHttpClient()
+
+    async def quote_twice():
+        loop_thread = threading.get_ident()
+        first = await client.get_global_quote({"symbol": "ibm"})
+        second = await client.get_global_quote({"symbol": "ibm"})
+        return loop_thread, first, second
+
+    loop_thread, first, second = asyncio.run(quote_twice())
+    cache.close()
+    assert client._client.requests_sent == 1, "Second quote should be answered from the cache"
+    assert first == second, "Cached quote doesn't match the original"
+    assert len(cache.threads) == 3, "Expected a miss, a put and a hit"
+    assert loop_thread not in cache.threads, "Cache should not block the event loop thread"
+    logging.warning("Successfully tested async test_cache_runs_off_the_event_loop")
+
+
+@pytest.mark.unit
+def test_query_income_statement():
+    client = MockAsyncAlphavantageClient()
+    event = {
+        "symbol": "IBM"
+    }
+    accounting_report = asyncio.run(client.get_income_statement(event))
+    assert accounting_report.success, "Success field is missing or False"
+    assert accounting_report.symbol == event["symbol"], "Symbol from results don't match event"
+    assert len(accounting_report.annualReports), "annualReports field is missing, empty or None"
+    assert len(accounting_report.quarterlyReports), "quarterlyReports field is missing, empty or None"
+    logging.warning(f"Successfully tested async test_query_income_statement for {event['symbol']}")
+
+
+@pytest.mark.unit
+def test_query_technical_indicator_sma():
+    client = MockAsyncAlphavantageClient()
+    event = {
+        "symbol": "ibm",
+        "function": "SMA"
+    }
+    quote = asyncio.run(client.get_technical_indicator(event))
+    assert quote.success, "Success field is missing or False"
+    assert len(quote.meta_data), "Meta Data field is missing, empty or None"
+    assert len(quote.data), "Technical Analysis: SMA field is missing, empty or None"
+    logging.warning(f"Successfully tested async test_query_technical_indicator_sma for {event['symbol']}")
@@ -1,4 +1,10 @@
+import contextlib
 import pytest
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pydantic import BaseModel
+from alphavantage_api_client import AlphavantageClient, AccountingReport, Quote, GlobalQuote, ResponseCache
+from alphavantage_api_client.client import _create_session, _is_cacheable, _RATE_LIMITED_RETRY_STATUSES
 from .mock_client import MockAlphavantageClient
 import logging
 
@@ -20,6 +26,8 @@ def test_get_intraday_quote():
     assert intraday_quote.symbol == event["symbol"], "Symbol from results don't match event"
     assert len(intraday_quote.meta_data) > 0, "Meta Data field is zero or not present"
     assert len(intraday_quote.data) > 0, "Data field is zero or not present"
+    most_recent_value = intraday_quote.get_most_recent_value()
+    assert most_recent_value["query_date"] == next(iter(intraday_quote.data)), "Most recent value has the wrong date"
     logging.warning(f"Successfully tested test_quote_stock_price for {event['symbol']}")
 
 
@@ -37,9 +45,26 @@ def test_get_global_quote():
     assert global_quote.symbol == event["symbol"], "Symbol from results don't match event"
     assert "meta_data" not in global_quote, "Metadata should not be present since it's not in the api"
     assert len(global_quote.data) > 0, "Data field is zero or not present"
+    assert global_quote.get_price() == global_quote.data["05. price"], "get_price doesn't match the quote data"
+    assert global_quote.get_open_price() == global_quote.get_data_value("02. open"), "get_open_price is wrong"
+    assert global_quote.get_data_value("99. missing") is None, "Missing fields should be None"
     logging.warning(f"Successfully tested test_quote_stock_price for {event['symbol']}")
 
 
+@pytest.mark.unit
+def test_get_many_global_quotes():
+
+    client = MockAlphavantageClient()
+    symbols = ["ibm", "tsla", "msft"]
+    global_quotes = client.get_many_global_quotes(symbols, max_workers=2)
+    assert [global_quote.symbol for global_quote in global_quotes] == symbols, "Results are not in request order"
+    assert all(global_quote.success for global_quote in global_quotes), "Success field is missing or False"
+    assert all(len(global_quote.data) for global_quote in global_quotes), "Data field is zero or not present"
+    with pytest.raises(TypeError):
+        client.get_many_global_quotes(symbols, 2, True)  # validate is keyword only
+    logging.warning(f"Successfully tested test_get_many_global_quotes for {symbols}")
+
+
 @pytest.mark.unit
 def test_get_cash_flow():
     
@@ -53,9 +78,47 @@ def test_get_cash_flow():
     assert accounting_report.symbol == event["symbol"], "Symbol from results don't match event"
     assert len(accounting_report.annualReports) > 0, "annualReports field is zero or not present"
     assert len(accounting_report.quarterlyReports) > 0, "quarterlyReports field is zero or not present"
+    assert accounting_report.get_most_recent_annual_report() is accounting_report.annualReports[0], \
+        "Most recent annual report should be the first one"
+    assert accounting_report.get_most_recent_quarterly_report() is accounting_report.quarterlyReports[0], \
+        "Most recent quarterly report should be the first one"
     logging.warning(f"Successfully tested test_get_cash_flow for {event['symbol']}")
 
 
+@pytest.mark.unit
+def test_most_recent_report_of_empty_response():
+    error_response = {"success": False, "limit_reached": False, "status_code": 200, "symbol": "tsla22",
+                      "Error Message": "Invalid API call"}
+    accounting_report = AccountingReport.from_trusted(error_response)
+    assert accounting_report.get_most_recent_annual_report() is None, "Expected None without annual reports"
+    assert accounting_report.get_most_recent_quarterly_report() is None, "Expected None without quarterly reports"
+    logging.warning("Successfully tested test_most_recent_report_of_empty_response")
+
+
+@pytest.mark.unit
+def test_empty_defaults_are_not_shared():
+    error_response = {"success": False, "limit_reached": False, "status_code": 200, "symbol": "tsla22"}
+    first, second = Quote.from_trusted(error_response), Quote.parse_obj(dict(error_response))
+    first.data["2022-01-01"] = {}
+    assert not second.data, "Quotes should not share the default data dict"
+    assert not Quote.from_trusted(error_response).data, "The default data dict was modified"
+    report = AccountingReport.from_trusted(error_response)
+    report.annualReports.append({})
+    assert not AccountingReport.parse_obj(dict(error_response)).annualReports, "The default reports list was modified"
+    logging.warning("Successfully tested test_empty_defaults_are_not_shared")
+
+
+@pytest.mark.unit
+def test_nested_response_is_not_copied():
+    class Position(BaseModel):
+        quote: GlobalQuote
+
+    global_quote = MockAlphavantageClient().get_global_quote({"symbol": "ibm"})
+    position = Position(quote=global_quote)
+    assert position.quote is global_quote, "Nested response should be reused instead of copied on validation"
+    logging.warning("Successfully tested test_nested_response_is_not_copied")
+
+
 @pytest.mark.unit
 def test_company_overview():
 
@@ -69,6 +132,7 @@ def test_company_overview():
     assert company_overview.symbol == event["symbol"], "Symbol from results don't match event"
     assert len(company_overview.ex_dividend_date), "ExDividendDate is missing or empty or None"
     assert len(company_overview.analyst_target_price), "analyst_target_price field is missing or empty or None"
+    assert company_overview.beta == "1.004", "beta should be read from the Beta field"
     logging.warning(f"Successfully tested test_company_overview for {event['symbol']}")
 
 
@@ -155,6 +219,33 @@ def test_query_technical_indicator_sma():
     logging.warning(f"Successfully tested test_query_technical_indicator_sma for {event['symbol']}")
 
 
+@pytest.mark.unit
+def test_trusted_response_matches_validated_response():
+    client = MockAlphavantageClient()
+    requests = [
+        (client.get_global_quote, {"symbol": "ibm"}),
+        (client.get_intraday_quote, {"symbol": "ibm", "interval": "5min"}),
+        (client.get_earnings, {"symbol": "ibm"}),
+        (client.get_company_overview, {"symbol": "IBM"}),
+        (client.get_real_gdp, {"function": "REAL_GDP"}),
+        (client.get_technical_indicator, {"symbol": "ibm", "function": "SMA"})
+    ]
+    for get_data, event in requests:
+        trusted = get_data(dict(event))
+        validated = get_data(dict(event), validate=True)
+        assert type(trusted) is type(validated), f"{get_data.__name__} returned different models"
+        assert trusted.dict() == validated.dict(), f"{get_data.__name__} trusted response differs from validated"
+    logging.warning("Successfully tested test_trusted_response_matches_validated_response")
+
+
+@pytest.mark.unit
+def test_client_rejects_unknown_attributes():
+    client = AlphavantageClient()
+    with pytest.raises(AttributeError):
+        client.api_key = "demo"  # typo of the builder method, should not silently create an attribute
+    logging.warning("Successfully tested test_client_rejects_unknown_attributes")
+
+
 @pytest.mark.unit
 def test_can_convert_to_json_string():
     
@@ -177,3 +268,139 @@ def test_can_get_data_from_alpha_vantage():
     assert len(results) > 0, "There should be data in the results"
 
     logging.warning("Successfully queried data using get_data_from_alpha_vantage")
+
+
+class ServiceUnavailableHandler(BaseHTTPRequestHandler):
+    """ Answers every request with the status, content type and body of the class """
+    status = 503
+    content_type = "text/plain"
+    body = b"Service Unavailable"
+    requests_received = 0
+
+    def do_GET(self):
+        type(self).requests_received += 1
+        self.send_response(self.status)
+        self.send_header("Content-Type", self.content_type)
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextlib.contextmanager
+def stub_server_client(handler):
+    """ A client sending its requests to a local server answering with ``handler`` """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    session = _create_session()
+    session.mount("http://", session.get_adapter("https://"))  # same retry policy, plain http for the stub server
+    rate_limited_session = _create_session(_RATE_LIMITED_RETRY_STATUSES)
+    rate_limited_session.mount("http://", rate_limited_session.get_adapter("https://"))
+
+    class LocalAlphavantageClient(AlphavantageClient):
+        __slots__ = ()
+        _base_url = f"http://127.0.0.1:{server.server_port}/query"
+        _session = session
+        _rate_limited_session = rate_limited_session
+
+    try:
+        yield LocalAlphavantageClient().with_api_key("demo")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.unit
+def test_persistent_server_error_returns_unsuccessful_response():
+    with stub_server_client(ServiceUnavailableHandler) as client:
+        global_quote = client.get_global_quote({"symbol": "ibm"})
+    assert ServiceUnavailableHandler.requests_received == 4, "Expected the request and 3 retries"
+    assert global_quote.success is False, "A 503 should not be successful"
+    assert global_quote.status_code == 503, "Status code of the last response should be returned"
+    assert global_quote.error_message == "Service Unavailable", "Error message should be the server response"
+    logging.warning("Successfully tested test_persistent_server_error_returns_unsuccessful_response")
+
+
+class CsvServiceUnavailableHandler(ServiceUnavailableHandler):
+    requests_received = 0
+
+
+@pytest.mark.unit
+def test_persistent_server_error_returns_unsuccessful_csv_response():
+    with stub_server_client(CsvServiceUnavailableHandler) as client:
+        global_quote = client.get_global_quote({"symbol": "ibm", "datatype": "csv"})
+    assert CsvServiceUnavailableHandler.requests_received == 4, "Expected the request and 3 retries"
+    assert global_quote.success is False, "A 503 should not be successful"
+    assert global_quote.status_code == 503, "Status code of the last response should be returned"
+    assert global_quote.csv is None, "A 503 has no csv data"
+    assert global_quote.error_message == "Service Unavailable", "Error message should be the server response"
+    logging.warning("Successfully tested test_persistent_server_error_returns_unsuccessful_csv_response")
+
+
+class TooManyRequestsHandler(ServiceUnavailableHandler):
+    status = 429
+    body = b"Too Many Requests"
+    requests_received = 0
+
+
+@pytest.mark.unit
+def test_rate_limited_client_does_not_retry_too_many_requests():
+    with stub_server_client(TooManyRequestsHandler) as client:
+        global_quote = client.with_rate_limit(600).get_global_quote({"symbol": "ibm"})
+    assert TooManyRequestsHandler.requests_received == 1, "A 429 should be left to the rate limiter, not retried"
+    assert global_quote.success is False, "A 429 should not be successful"
+    assert global_quote.status_code == 429, "Status code of the response should be returned"
+    logging.warning("Successfully tested test_rate_limited_client_does_not_retry_too_many_requests")
+
+
+class HtmlPageHandler(ServiceUnavailableHandler):
+    status = 200
+    content_type = "text/html"
+    body = b"<html><body>Gateway maintenance</body></html>"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("validate", [False, True])
+def test_body_that_is_not_json_returns_unsuccessful_response(validate):
+    with stub_server_client(HtmlPageHandler) as client:
+        global_quote = client.get_global_quote({"symbol": "ibm"}, validate)
+        company_overview = client.get_company_overview({"symbol": "ibm"}, validate)
+    for response in (global_quote, company_overview):
+        assert response.success is False, "A body that isn't json should not be successful"
+        assert response.status_code == 200, "Status code of the response should be returned"
+        assert response.error_message == HtmlPageHandler.body.decode(), "Error message should be the server response"
+    logging.warning("Successfully tested test_body_that_is_not_json_returns_unsuccessful_response")
+
+
+class OverviewHtmlPageHandler(HtmlPageHandler):
+    requests_received = 0
+
+
+@pytest.mark.unit
+def test_unsuccessful_response_is_not_cached(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache"))
+    with stub_server_client(OverviewHtmlPageHandler) as client:
+        client.with_response_cache(cache)
+        client.get_company_overview({"symbol": "ibm"})
+        company_overview = client.get_company_overview({"symbol": "ibm"})
+    assert OverviewHtmlPageHandler.requests_received == 2, "Unsuccessful response should not be answered from cache"
+    assert not company_overview.success, "An html page should not be successful"
+    assert cache.get({"function": "OVERVIEW", "symbol": "ibm"}) is None, "Unsuccessful response was cached"
+    cache.close()
+    logging.warning("Successfully tested test_unsuccessful_response_is_not_cached")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("requested_data, cacheable", [
+    ({"success": True, "limit_reached": False, "status_code": 200, "symbol": "ibm", "Global Quote": {}}, True),
+    ({"success": True, "limit_reached": False, "status_code": 200, "symbol": "ibm", "csv": "timestamp,open"}, True),
+    ({"success": True, "limit_reached": False, "status_code": 200, "symbol": "ibm"}, False),
+    ({"success": True, "limit_reached": False, "status_code": 200, "symbol": "ibm", "csv": None}, False),
+    ({"success": True, "limit_reached": False, "status_code": 503, "symbol": "ibm", "Global Quote": {}}, False),
+    ({"success": False, "limit_reached": False, "status_code": 200, "Error Message": "Invalid API call"}, False),
+])
+def test_only_responses_with_data_are_cacheable(requested_data, cacheable):
+    assert _is_cacheable(requested_data) is cacheable, f"Wrong cache decision for {requested_data}"
+    logging.warning("Successfully tested test_only_responses_with_data_are_cacheable")
@@ -0,0 +1,13 @@
+import pytest
+import subprocess
+import sys
+import logging
+
+
+@pytest.mark.unit
+def test_import_does_not_load_asyncio():
+    # run in a fresh interpreter, pytest itself may already have imported asyncio
+    code = "import sys, alphavantage_api_client; print('asyncio' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "False", "asyncio should only be imported by async callers"
+    logging.warning("Successfully tested test_import_does_not_load_asyncio")
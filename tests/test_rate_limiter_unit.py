@@ -0,0 +1,39 @@
+import pytest
+from alphavantage_api_client import RateLimiter
+import logging
+
+
+class FakeClock:
+    """ Time only moves when the test advances it """
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+def test_requests_are_spaced_evenly():
+    limiter = RateLimiter(60, clock=FakeClock())  # one request per second
+    delays = [limiter.reserve() for _ in range(3)]
+    assert delays == [0, 1, 2], "Requests should wait one more interval each"
+    logging.warning("Successfully tested test_requests_are_spaced_evenly")
+
+
+@pytest.mark.unit
+def test_idle_time_frees_slots():
+    clock = FakeClock()
+    limiter = RateLimiter(5, clock=clock)  # free keys, one request every 12 seconds
+    assert limiter.reserve() == 0, "First request should not wait"
+    clock.now += 5
+    assert limiter.reserve() == 7, "Request 5 seconds later should wait the rest of the interval"
+    clock.now += 60
+    assert limiter.reserve() == 0, "Request after a long pause should not wait"
+    logging.warning("Successfully tested test_idle_time_frees_slots")
+
+
+@pytest.mark.unit
+def test_rate_limit_must_be_positive():
+    with pytest.raises(ValueError):
+        RateLimiter(0)
@@ -0,0 +1,50 @@
+import pytest
+import sqlite3
+from alphavantage_api_client import ResponseCache
+import logging
+
+
+@pytest.mark.unit
+def test_can_get_cached_response(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache"))
+    event = {
+        "function": "OVERVIEW",
+        "symbol": "IBM"
+    }
+    response = {"success": True, "limit_reached": False, "status_code": 200, "Symbol": "IBM"}
+    assert cache.get(event) is None, "Nothing has been cached yet"
+    cache.put(event, response)
+    assert cache.get(event) == response, "Cached response doesn't match the stored response"
+    assert cache.get({"symbol": "IBM", "function": "OVERVIEW", "apikey": "demo"}) == response, \
+        "Parameter order and api key should not change the cache key"
+    assert cache.get({"function": "OVERVIEW", "symbol": "TSLA"}) is None, "Different symbol should not be cached"
+    cache.close()
+    logging.warning("Successfully tested test_can_get_cached_response")
+
+
+@pytest.mark.unit
+def test_expired_response_is_not_returned(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache"), ttls={"GLOBAL_QUOTE": -1})
+    event = {
+        "function": "GLOBAL_QUOTE",
+        "symbol": "IBM"
+    }
+    cache.put(event, {"success": True})
+    assert cache.get(event) is None, "Expired response should not be returned"
+    cache.close()
+    logging.warning("Successfully tested test_expired_response_is_not_returned")
+
+
+@pytest.mark.unit
+def test_expired_responses_are_purged(tmp_path):
+    path = str(tmp_path / "cache")
+    cache = ResponseCache(path, ttls={"GLOBAL_QUOTE": -1})
+    for symbol in ("IBM", "TSLA", "MSFT"):
+        cache.put({"function": "GLOBAL_QUOTE", "symbol": symbol}, {"success": True})
+    cache.put({"function": "OVERVIEW", "symbol": "IBM"}, {"success": True})
+    cache.close()
+    with sqlite3.connect(path) as connection:
+        rows = connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+    connection.close()
+    assert rows == 1, "Expired responses should be deleted when a new response is stored"
+    logging.warning("Successfully tested test_expired_responses_are_purged")